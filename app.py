@@ -1,50 +1,123 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 import os
+import hashlib
+import threading
+import cachetools
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from azure.search.documents import SearchClient
 from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import RequestsTransport
 
 app = Flask(__name__)
 
+# --- Static file caching (URLs carry a content version, so a deploy busts the cache) ---
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
+static_hash = hashlib.blake2b(digest_size=8)
+for static_name in sorted(os.listdir(app.static_folder)):
+    with open(os.path.join(app.static_folder, static_name), "rb") as f:
+        static_hash.update(f.read())
+STATIC_VERSION = static_hash.hexdigest()
+
+# --- Request size limits (rejected before any Azure call) ---
+# The only request body is the small /search JSON payload
+MAX_CONTENT_LENGTH = 16 * 1024
+MAX_QUERY_LENGTH = 1024
+app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
+
+# --- Shared Azure transport (one connection pool for all Azure clients) ---
+azure_session = requests.Session()
+# Same no-retry adapter azure-core mounts itself, so its RetryPolicy is the only retry layer
+azure_adapter = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+)
+azure_session.mount("https://", azure_adapter)
+azure_session.mount("http://", azure_adapter)
+azure_transport = RequestsTransport(session=azure_session, session_owner=False)
+
 # --- Azure AI Search config ---
 SEARCH_ENDPOINT = os.getenv("SEARCH_ENDPOINT")
 SEARCH_API_KEY = os.getenv("SEARCH_API_KEY")
 SEARCH_INDEX_NAME = os.getenv("SEARCH_INDEX_NAME")
+# Fields the handler reads; set SEARCH_SELECT_FIELDS="" to return every field instead
+SEARCH_SELECT_FIELDS = [
+    field.strip()
+    for field in os.getenv("SEARCH_SELECT_FIELDS", "title,content").split(",")
+    if field.strip()
+] or None
 
 search_client = None
 if SEARCH_ENDPOINT and SEARCH_API_KEY and SEARCH_INDEX_NAME:
     search_client = SearchClient(
         endpoint=SEARCH_ENDPOINT,
         index_name=SEARCH_INDEX_NAME,
-        credential=AzureKeyCredential(SEARCH_API_KEY)
+        credential=AzureKeyCredential(SEARCH_API_KEY),
+        transport=azure_transport
     )
 
+# --- Search result cache (query -> (serialized JSON body, ETag)) ---
+SEARCH_CACHE = cachetools.TTLCache(maxsize=2048, ttl=60)
+SEARCH_CACHE_LOCK = threading.RLock()
+SEARCH_CACHE_HEADERS = {
+    "Cache-Control": "public, max-age=30, s-maxage=60",
+    "Vary": "Accept-Encoding",
+}
+
 @app.route("/")
 def index():
-    return render_template("index.html")
+    return render_template("index.html", static_version=STATIC_VERSION)
 
 @app.route("/health")
 def health():
     return {"status": "ok"}
 
-@app.route("/search", methods=["POST"])
+@app.route("/search", methods=["GET", "POST"])
 def search():
     if not search_client:
         return jsonify({"error": "Search service not configured"}), 500
 
-    query = request.json.get("query")
+    if request.method == "GET":
+        query = request.args.get("query")
+    elif not request.is_json:
+        return jsonify({"error": "Expected application/json"}), 415
+    else:
+        data = request.get_json(silent=True)
+        query = data.get("query") if isinstance(data, dict) else None
+    if not isinstance(query, str):
+        return jsonify({"results": []})
+    query = query.strip()
     if not query:
         return jsonify({"results": []})
+    if len(query) > MAX_QUERY_LENGTH:
+        return jsonify({"error": "Query too long"}), 400
+
+    with SEARCH_CACHE_LOCK:
+        cached = SEARCH_CACHE.get(query)
+    if cached is None:
+        search_results = search_client.search(query, top=5, select=SEARCH_SELECT_FIELDS)
+        results = [
+            {"title": r.get("title", "Result"), "content": r.get("content", "")}
+            for r in search_results
+        ]
 
-    results = []
-    search_results = search_client.search(query, top=5)
+        body = orjson.dumps({"results": results})
+        cached = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+        with SEARCH_CACHE_LOCK:
+            SEARCH_CACHE[query] = cached
 
-    for r in search_results:
-        results.append({
-            "title": r.get("title", "Result"),
-            "content": r.get("content", "")
-        })
+    body, etag = cached
+    response = Response(body, mimetype="application/json")
+    if request.method != "GET":
+        return response
 
-    return jsonify({"results": results})
+    # Only GET responses are stored by shared caches
+    response.headers.update(SEARCH_CACHE_HEADERS)
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8000)
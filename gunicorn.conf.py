@@ -0,0 +1,10 @@
+import multiprocessing
+import os
+
+# --- Gunicorn config (Azure calls are I/O-bound, so use gevent workers) ---
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "gevent"
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_connections = 1000
+keepalive = 30
+timeout = 60
@@ -4,11 +4,7 @@ async function runSearch() {
 
   resultsDiv.innerHTML = "Searching...";
 
-  const res = await fetch("/search", {
-    method: "POST",
-    headers: {"Content-Type": "application/json"},
-    body: JSON.stringify({query: q})
-  });
+  const res = await fetch("/search?query=" + encodeURIComponent(q));
 
   const data = await res.json();
   resultsDiv.innerHTML = "";
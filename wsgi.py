@@ -0,0 +1,5 @@
+# Patch sockets before Flask / Azure SDKs (and requests) are imported
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402